@@ -43,6 +43,9 @@ class Settings:
     proxy_list: Tuple[str, ...]
     monitor_poll_interval_seconds: float
     monitor_backoff_base_seconds: float
+    monitor_max_concurrent_endpoints: int
+    monitor_http_max_connections: int
+    monitor_http_max_keepalive: int
 
     @property
     def has_proxies(self) -> bool:
@@ -56,6 +59,9 @@ def get_settings() -> Settings:
     proxy_list = _parse_proxy_list(_get_env("PROXY_LIST"))
     monitor_poll_interval = float(_get_env("MONITOR_POLL_INTERVAL_SECONDS", "30"))
     monitor_backoff_base = float(_get_env("MONITOR_BACKOFF_BASE_SECONDS", "120"))
+    monitor_max_concurrent = int(_get_env("MONITOR_MAX_CONCURRENT_ENDPOINTS", "8"))
+    monitor_http_max_connections = int(_get_env("MONITOR_HTTP_MAX_CONNECTIONS", "100"))
+    monitor_http_max_keepalive = int(_get_env("MONITOR_HTTP_MAX_KEEPALIVE", "50"))
 
     if not supabase_url:
         raise RuntimeError("SUPABASE_URL must be configured.")
@@ -68,4 +74,7 @@ def get_settings() -> Settings:
         proxy_list=proxy_list,
         monitor_poll_interval_seconds=monitor_poll_interval,
         monitor_backoff_base_seconds=monitor_backoff_base,
+        monitor_max_concurrent_endpoints=max(1, monitor_max_concurrent),
+        monitor_http_max_connections=max(1, monitor_http_max_connections),
+        monitor_http_max_keepalive=max(1, monitor_http_max_keepalive),
     )
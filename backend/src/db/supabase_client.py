@@ -1,9 +1,11 @@
 from __future__ import annotations
 
+import asyncio
 from datetime import datetime, timezone
-from typing import Any, Mapping, MutableMapping, Sequence, List
+from typing import Any, AsyncIterator, Mapping, MutableMapping, Sequence
 
 import httpx
+import orjson
 
 from backend.src.config import Settings, get_settings
 
@@ -41,10 +43,21 @@ class SupabaseClient:
         response = await self._client.post(
             "/listings",
             params={"on_conflict": "external_id", "return": "representation"},
-            json=dict(payload),
+            content=orjson.dumps(dict(payload)),
         )
         return self._parse_single(response, "upsert_listing")
 
+    async def upsert_listings_bulk(self, payloads: Sequence[Mapping[str, Any]]) -> None:
+        if not payloads:
+            return
+        await self._request(
+            "POST",
+            "/listings",
+            params={"on_conflict": "external_id"},
+            headers={"Prefer": "resolution=merge-duplicates,return=minimal"},
+            content=orjson.dumps([dict(payload) for payload in payloads]),
+        )
+
     async def record_seen_listing(self, external_id: str, *, metadata: MutableMapping[str, Any] | None = None) -> dict[str, Any]:
         body: dict[str, Any] = {"external_id": external_id, "last_seen_at": datetime.now(timezone.utc).isoformat()}
         if metadata:
@@ -53,10 +66,23 @@ class SupabaseClient:
         response = await self._client.post(
             "/seen_listings",
             params={"on_conflict": "external_id", "return": "representation"},
-            json=body,
+            content=orjson.dumps(body),
         )
         return self._parse_single(response, "record_seen_listing")
 
+    async def record_seen_listings_bulk(self, external_ids: Sequence[str]) -> None:
+        if not external_ids:
+            return
+        last_seen_at = datetime.now(timezone.utc).isoformat()
+        body = [{"external_id": external_id, "last_seen_at": last_seen_at} for external_id in external_ids]
+        await self._request(
+            "POST",
+            "/seen_listings",
+            params={"on_conflict": "external_id"},
+            headers={"Prefer": "resolution=merge-duplicates,return=minimal"},
+            content=orjson.dumps(body),
+        )
+
     async def fetch_active_preferences(self, *, columns: str = "*") -> Sequence[dict[str, Any]]:
         response = await self._client.get(
             "/user_preferences",
@@ -71,31 +97,45 @@ class SupabaseClient:
             raise SupabaseClientError("Unexpected payload when fetching preferences.")
         return data
 
-    async def fetch_seen_listing_ids(self, *, chunk_size: int = 500) -> Sequence[str]:
-        results: List[str] = []
-        offset = 0
-
-        while True:
-            headers = {"Range": f"items={offset}-{offset + chunk_size - 1}"}
-            response = await self._client.get(
-                "/seen_listings",
-                params={"select": "external_id"},
-                headers=headers,
+    async def fetch_seen_listing_ids(self, *, chunk_size: int = 500) -> AsyncIterator[str]:
+        first = await self._client.get(
+            "/seen_listings",
+            params={"select": "external_id"},
+            headers={"Range": f"items=0-{chunk_size - 1}", "Prefer": "count=exact"},
+        )
+        total = self._parse_content_range_total(first)
+        payloads = [self._parse_json(first, "fetch_seen_listing_ids")]
+
+        if total > chunk_size:
+            responses = await asyncio.gather(
+                *(
+                    self._client.get(
+                        "/seen_listings",
+                        params={"select": "external_id"},
+                        headers={"Range": f"items={offset}-{offset + chunk_size - 1}"},
+                    )
+                    for offset in range(chunk_size, total, chunk_size)
+                )
             )
-            payload = self._parse_json(response, "fetch_seen_listing_ids")
+            payloads.extend(self._parse_json(response, "fetch_seen_listing_ids") for response in responses)
 
+        for payload in payloads:
             if not isinstance(payload, list):
                 raise SupabaseClientError("Unexpected payload when fetching seen listing IDs.")
-
-            batch_ids = [item.get("external_id") for item in payload if isinstance(item, dict) and item.get("external_id")]
-            results.extend(batch_ids)
-
-            if len(payload) < chunk_size:
-                break
-
-            offset += chunk_size
-
-        return tuple(results)
+            for item in payload:
+                if isinstance(item, dict) and item.get("external_id"):
+                    yield item["external_id"]
+
+    @staticmethod
+    def _parse_content_range_total(response: httpx.Response) -> int:
+        content_range = response.headers.get("Content-Range", "")
+        _, _, total = content_range.partition("/")
+        try:
+            return int(total)
+        except ValueError as exc:
+            raise SupabaseClientError(
+                f"Missing or malformed Content-Range header: {content_range!r}"
+            ) from exc
 
     async def _request(self, method: str, path: str, **kwargs: Any) -> httpx.Response:
         response = await self._client.request(method, path, **kwargs)
@@ -107,8 +147,8 @@ class SupabaseClient:
 
     def _parse_json(self, response: httpx.Response, context: str) -> Any:
         try:
-            return response.json()
-        except ValueError as exc:
+            return orjson.loads(response.content)
+        except orjson.JSONDecodeError as exc:
             raise SupabaseClientError(f"Supabase returned non-JSON payload for {context}.") from exc
 
     def _parse_single(self, response: httpx.Response, context: str) -> dict[str, Any]:
@@ -0,0 +1,37 @@
+from __future__ import annotations
+
+import asyncio
+import atexit
+from functools import lru_cache
+
+from backend.src.db.supabase_client import SupabaseClient
+from backend.src.monitoring.session_manager import SessionManager
+
+
+@lru_cache(maxsize=1)
+def get_session_manager() -> SessionManager:
+    """Return the process-wide SessionManager, creating it on first use."""
+    return SessionManager()
+
+
+@lru_cache(maxsize=1)
+def get_supabase_client() -> SupabaseClient:
+    """Return the process-wide SupabaseClient, creating it on first use."""
+    return SupabaseClient()
+
+
+async def _aclose_shared() -> None:
+    if get_session_manager.cache_info().currsize:
+        await get_session_manager().close()
+    if get_supabase_client.cache_info().currsize:
+        await get_supabase_client().close()
+
+
+@atexit.register
+def _close_shared_clients() -> None:
+    try:
+        asyncio.run(_aclose_shared())
+    except RuntimeError:
+        # No usable event loop at interpreter shutdown; sockets are
+        # reclaimed by the OS anyway.
+        pass
@@ -2,8 +2,12 @@ from __future__ import annotations
 
 import asyncio
 import logging
-from typing import Iterable, List, Sequence, Set
+from typing import Any, Iterable, List, Mapping, Sequence
 
+from pybloom_live import ScalableBloomFilter
+from realtime.connection import Socket
+
+from backend.src.config import get_settings
 from backend.src.db.supabase_client import SupabaseClient, SupabaseClientError
 from backend.src.monitoring.listing_parser import ListingSummary
 
@@ -15,7 +19,15 @@ class ChangeDetectorError(RuntimeError):
 
 
 class ChangeDetector:
-    """Tracks seen listings locally and within Supabase."""
+    """
+    Tracks seen listings locally and within Supabase.
+
+    Local dedup uses a scalable Bloom filter (~10 bits per key) instead of a
+    Python set, keeping memory bounded as the seen-listing history grows.
+    False positives only suppress a listing that would have been re-upserted
+    anyway; there are no false negatives.
+    """
+
     def __init__(
         self,
         *,
@@ -25,9 +37,10 @@ class ChangeDetector:
         self._supabase_client = supabase_client or SupabaseClient()
         self._owns_client = supabase_client is None
         self._preload_existing = preload_existing
-        self._seen_ids: Set[str] = set()
+        self._seen_ids = ScalableBloomFilter(initial_capacity=100_000, error_rate=0.001)
         self._loaded = False
         self._load_lock = asyncio.Lock()
+        self._realtime_task: asyncio.Task[None] | None = None
 
     async def __aenter__(self) -> "ChangeDetector":
         return self
@@ -36,24 +49,73 @@ class ChangeDetector:
         await self.close()
 
     async def close(self) -> None:
+        if self._realtime_task is not None:
+            self._realtime_task.cancel()
+            try:
+                await self._realtime_task
+            except (asyncio.CancelledError, Exception):  # noqa: BLE001
+                pass
+            self._realtime_task = None
         if self._owns_client:
             await self._supabase_client.close()
 
+    def start_realtime_sync(self) -> None:
+        """
+        Subscribe to seen_listings inserts over Supabase Realtime.
+
+        IDs recorded by other monitor workers then land in the local filter
+        push-style, so the bulk preload only pays off once at cold start and
+        the filter stays fresh afterwards without re-querying. Connection
+        failures are logged and leave polling behaviour unchanged.
+        """
+        if self._realtime_task is None:
+            self._realtime_task = asyncio.get_running_loop().create_task(self._realtime_sync_loop())
+
+    async def _realtime_sync_loop(self) -> None:
+        settings = get_settings()
+        ws_base = settings.supabase_url.rstrip("/").replace("http", "ws", 1)
+        socket = Socket(
+            f"{ws_base}/realtime/v1/websocket?apikey={settings.supabase_service_key}&vsn=1.0.0",
+            auto_reconnect=True,
+        )
+        try:
+            # The public connect()/join()/listen() wrappers call
+            # run_until_complete and cannot run inside an active event loop,
+            # so drive the async internals directly.
+            await socket._connect()
+            channel = socket.set_channel("realtime:public:seen_listings")
+            channel.on("INSERT", self._on_seen_insert)
+            await channel._join()
+            await asyncio.gather(socket._listen(), socket._keep_alive())
+        except asyncio.CancelledError:
+            raise
+        except Exception as exc:  # noqa: BLE001
+            logger.warning("Realtime seen-listing sync unavailable: %s", exc)
+
+    def _on_seen_insert(self, payload: Mapping[str, Any]) -> None:
+        record = payload.get("record")
+        external_id = record.get("external_id") if isinstance(record, dict) else None
+        if external_id:
+            self._seen_ids.add(external_id)
+
     async def filter_new_listings(self, listings: Sequence[ListingSummary]) -> List[ListingSummary]:
         await self._ensure_loaded()
 
-        new_listings: List[ListingSummary] = []
-        to_persist: List[ListingSummary] = []
-
-        for listing in listings:
-            if listing.external_id in self._seen_ids:
-                continue
-            self._seen_ids.add(listing.external_id)
-            new_listings.append(listing)
-            to_persist.append(listing)
+        # The dict comprehension collapses in-batch duplicates in one C-level
+        # pass; the membership comprehension is the only per-listing Python
+        # work left. (A true set difference would need the seen side to be a
+        # set, which the Bloom filter deliberately is not.)
+        incoming = {listing.external_id: listing for listing in listings}
+        new_listings: List[ListingSummary] = [
+            listing for external_id, listing in incoming.items() if external_id not in self._seen_ids
+        ]
 
-        if to_persist:
-            await self._persist_seen(to_persist)
+        if new_listings:
+            # Bloom filters cannot un-add, so only mark listings as seen once
+            # Supabase has confirmed the persist.
+            await self._persist_seen(new_listings)
+            for listing in new_listings:
+                self._seen_ids.add(listing.external_id)
 
         return new_listings
 
@@ -65,21 +127,15 @@ class ChangeDetector:
             if self._loaded or not self._preload_existing:
                 return
             try:
-                existing = await self._supabase_client.fetch_seen_listing_ids()
+                async for external_id in self._supabase_client.fetch_seen_listing_ids():
+                    self._seen_ids.add(external_id)
             except SupabaseClientError as exc:
                 logger.warning("Unable to preload seen listings from Supabase: %s", exc)
-                existing = ()
-            self._seen_ids.update(existing)
             self._loaded = True
 
     async def _persist_seen(self, listings: Iterable[ListingSummary]) -> None:
-        tasks = [
-            self._supabase_client.record_seen_listing(listing.external_id)
-            for listing in listings
-        ]
+        external_ids = [listing.external_id for listing in listings]
         try:
-            await asyncio.gather(*tasks)
+            await self._supabase_client.record_seen_listings_bulk(external_ids)
         except (SupabaseClientError, Exception) as exc:
-            for listing in listings:
-                self._seen_ids.discard(listing.external_id)
             raise ChangeDetectorError("Failed to persist seen listings.") from exc
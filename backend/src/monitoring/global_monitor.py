@@ -2,11 +2,14 @@ from __future__ import annotations
 
 import asyncio
 import logging
+import os
 import time
-from typing import AsyncIterator, Iterable, Sequence
+from concurrent.futures import ProcessPoolExecutor
+from typing import AsyncIterator, Iterable, List, Optional, Sequence, Tuple
 
 from backend.src.config import get_settings
 from backend.src.db.supabase_client import SupabaseClient
+from backend.src.monitoring._session import get_session_manager, get_supabase_client
 from backend.src.monitoring.change_detector import ChangeDetector
 from backend.src.monitoring.html_fetcher import fetch_search_page
 from backend.src.monitoring.listing_parser import ListingSummary, parse_listing_summaries
@@ -14,6 +17,11 @@ from backend.src.monitoring.session_manager import SessionManager
 
 logger = logging.getLogger(__name__)
 
+# Parsing is CPU-bound pure Python; running it on the event-loop thread would
+# stall all concurrent fetches for the duration. Worker processes are spawned
+# lazily on first submit.
+_PARSER_POOL = ProcessPoolExecutor(max_workers=os.cpu_count())
+
 DEFAULT_SEARCH_ENDPOINTS: Sequence[str] = (
     "https://www.immobilienscout24.de/Suche/de/berlin/berlin/wohnung-mieten",
     "https://www.immobilienscout24.de/Suche/de/berlin/berlin/wohnung-mieten?pricetype=rent&sorting=2",
@@ -30,19 +38,41 @@ async def monitor_all_listings(
     """
     Continuously poll ImmobilienScout24 search endpoints, yielding new listings.
 
-    Tracks latency and success metrics per cycle while persisting seen listings via Supabase.
+    Endpoints are fetched concurrently each cycle (capped by
+    ``monitor_max_concurrent_endpoints``), so cycle latency tracks the slowest
+    endpoint rather than the sum of all of them. Tracks latency and success
+    metrics per cycle while persisting seen listings via Supabase.
     """
     settings = get_settings()
     poll_interval = max(5.0, settings.monitor_poll_interval_seconds)
     endpoints = search_endpoints or DEFAULT_SEARCH_ENDPOINTS
 
-    own_session_manager = session_manager is None
-    own_supabase_client = supabase_client is None
     own_change_detector = change_detector is None
 
-    session_manager = session_manager or SessionManager()
-    supabase_client = supabase_client or SupabaseClient()
+    # Defaults are the process-wide shared clients so repeated invocations
+    # reuse pooled connections; explicit arguments remain caller-owned.
+    session_manager = session_manager or get_session_manager()
+    supabase_client = supabase_client or get_supabase_client()
     change_detector = change_detector or ChangeDetector(supabase_client=supabase_client)
+    if own_change_detector:
+        change_detector.start_realtime_sync()
+
+    semaphore = asyncio.Semaphore(settings.monitor_max_concurrent_endpoints)
+
+    async def _run_one(url: str) -> Tuple[str, List[ListingSummary], float, Optional[Exception]]:
+        async with semaphore:
+            request_started = time.perf_counter()
+            try:
+                html = await fetch_search_page(url, session_manager)
+                if html is None:  # 304 Not Modified: nothing new to parse
+                    return url, [], time.perf_counter() - request_started, None
+                listings = await asyncio.get_running_loop().run_in_executor(
+                    _PARSER_POOL, parse_listing_summaries, html
+                )
+                new_listings = await change_detector.filter_new_listings(listings)
+            except Exception as exc:  # noqa: BLE001
+                return url, [], 0.0, exc
+            return url, new_listings, time.perf_counter() - request_started, None
 
     try:
         while True:
@@ -52,20 +82,17 @@ async def monitor_all_listings(
             new_count = 0
             latencies: list[float] = []
 
-            for url in endpoints:
-                request_started = time.perf_counter()
-                try:
-                    html = await fetch_search_page(url, session_manager)
-                    listings = parse_listing_summaries(html)
-                    new_listings = await change_detector.filter_new_listings(listings)
-                    for listing in new_listings:
-                        yield listing
-                    new_count += len(new_listings)
-                    successes += 1
-                    latencies.append(time.perf_counter() - request_started)
-                except Exception as exc:  # noqa: BLE001
+            tasks = [asyncio.create_task(_run_one(url)) for url in endpoints]
+            for next_done in asyncio.as_completed(tasks):
+                url, new_listings, latency, exc = await next_done
+                if exc is not None:
                     logger.warning("Monitor failed for %s: %s", url, exc)
                     continue
+                for listing in new_listings:
+                    yield listing
+                new_count += len(new_listings)
+                successes += 1
+                latencies.append(latency)
 
             success_rate = successes / total if total else 0.0
             avg_latency = sum(latencies) / len(latencies) if latencies else 0.0
@@ -85,7 +112,3 @@ async def monitor_all_listings(
     finally:
         if own_change_detector:
             await change_detector.close()
-        if own_supabase_client:
-            await supabase_client.close()
-        if own_session_manager:
-            await session_manager.close()
@@ -1,10 +1,8 @@
 from __future__ import annotations
 
 import asyncio
-import gzip
 import logging
 import random
-import zlib
 from typing import Optional
 
 import httpx
@@ -12,46 +10,52 @@ import httpx
 from backend.src.config import get_settings
 from backend.src.monitoring.session_manager import SessionManager, SessionManagerError
 
-try:  # Optional Brotli support
-    import brotlicffi as _brotli  # type: ignore
-except ImportError:
-    try:
-        import brotli as _brotli  # type: ignore
-    except ImportError:
-        _brotli = None
-
 logger = logging.getLogger(__name__)
 
+# Backoff bounds are fixed for the process lifetime, so resolve them once at
+# import instead of calling get_settings() on every fetch attempt. Tests that
+# need different delays can monkeypatch these module constants.
+_SETTINGS = get_settings()
+_BASE_DELAY = max(1.0, _SETTINGS.monitor_backoff_base_seconds)
+_MAX_DELAY = max(_BASE_DELAY * 8, 60.0)
+# Exponential backoff delays per retry, capped at _MAX_DELAY. The schedule
+# saturates at the cap, so clamping the index keeps it exact for any
+# max_attempts.
+_DELAY_SCHEDULE = tuple(min(_MAX_DELAY, _BASE_DELAY * (1 << i)) for i in range(8))
+
 
 async def fetch_search_page(
     url: str,
     session_manager: SessionManager,
     *,
     max_attempts: int = 3,
-) -> str:
+) -> str | None:
     """
     Retrieve an ImmobilienScout24 search page and return raw HTML.
 
+    Returns ``None`` when the server answers 304 Not Modified to a conditional
+    request, signalling that the page is unchanged since the previous cycle.
     Retries on transient network failures while applying exponential backoff with jitter.
     """
-    settings = get_settings()
-    base_delay = max(1.0, settings.monitor_backoff_base_seconds)
-    max_delay = max(base_delay * 8, 60.0)
     last_exc: Optional[Exception] = None
 
     for attempt in range(1, max_attempts + 1):
         try:
             response = await session_manager.get(url)
+            if response.status_code == 304:
+                return None
             response.raise_for_status()
-            return _decode_body(response)
+            # httpx decompresses gzip/deflate/brotli incrementally while
+            # reading, so the raw compressed body is never held alongside
+            # the decoded text.
+            return response.text
         except (SessionManagerError, httpx.HTTPError, ValueError, OSError) as exc:
             last_exc = exc
             if attempt >= max_attempts:
                 break
 
-            delay = min(max_delay, base_delay * (2 ** (attempt - 1)))
-            jitter = random.uniform(0, delay * 0.3)
-            sleep_for = delay + jitter
+            delay = _DELAY_SCHEDULE[min(attempt - 1, len(_DELAY_SCHEDULE) - 1)]
+            sleep_for = delay * random.uniform(1.0, 1.3)
             logger.warning(
                 "fetch_search_page retry %s/%s for %s due to %s; sleeping %.2fs",
                 attempt,
@@ -63,18 +67,3 @@ async def fetch_search_page(
             await asyncio.sleep(sleep_for)
 
     raise SessionManagerError(f"Failed to fetch {url} after {max_attempts} attempts") from last_exc
-
-
-def _decode_body(response: httpx.Response) -> str:
-    content = response.content
-    encoding = (response.headers.get("content-encoding") or "").lower()
-
-    if encoding == "gzip":
-        content = gzip.decompress(content)
-    elif encoding == "deflate":
-        content = zlib.decompress(content)
-    elif encoding == "br" and _brotli is not None:
-        content = _brotli.decompress(content)
-
-    text_encoding = response.encoding or "utf-8"
-    return content.decode(text_encoding, errors="replace")
@@ -4,8 +4,16 @@ import re
 from datetime import datetime, timezone
 from typing import List, Optional
 
+import soupsieve as sv
 from bs4 import BeautifulSoup
-from pydantic import BaseModel, Field, HttpUrl, ValidationError
+from pydantic import BaseModel, Field
+
+try:  # Prefer the C-based lxml tree builder; html.parser is a pure-Python fallback
+    import lxml  # noqa: F401
+except ImportError:
+    _SOUP_FEATURES = "html.parser"
+else:
+    _SOUP_FEATURES = "lxml"
 
 
 class ListingSummary(BaseModel):
@@ -15,18 +23,36 @@ class ListingSummary(BaseModel):
     rooms: float | None = None
     size_sqm: float | None = None
     district: str | None = None
-    detail_url: HttpUrl
+    detail_url: str
     first_seen_at: datetime = Field(default_factory=lambda: datetime.now(timezone.utc))
 
 
+_HAS_CARDS_PATTERN = re.compile(r"data-is24-expose-id=|data-obid=")
 _PRICE_PATTERN = re.compile(r"([0-9][0-9\.\s]*)")
-_FLOAT_PATTERN = re.compile(r"([0-9]+(?:[.,][0-9]+)?)")
+# Rooms and living space are pulled from the card text in one combined pass
+# instead of two selector walks plus two separate regex searches.
+_CRITERIA_PATTERN = re.compile(r"(?P<rooms>[0-9]+(?:[.,][0-9]+)?)\s*Zimmer|(?P<sqm>[0-9]+(?:[.,][0-9]+)?)\s*m²")
 _ID_PATTERN = re.compile(r"(\d+)$")
 
+# Selectors are compiled once at import time; soupsieve otherwise re-parses the
+# selector grammar on every select_one call inside the per-card loop.
+_SEL_CARDS = sv.compile("[data-is24-expose-id], article[data-obid]")
+_SEL_TITLE = sv.compile(".result-list-entry__brand-title, .result-list-entry__data h5, h2, h3")
+_SEL_PRICE = sv.compile(
+    "[data-qa='cold-rent'], .result-list-entry__primary-criterion strong, .result-list-entry__finance strong"
+)
+_SEL_DISTRICT = sv.compile(".result-list-entry__address, address, [data-qa='district']")
+_SEL_LINK = sv.compile("a")
+
 
 def parse_listing_summaries(html: str, *, base_url: str = "https://www.immobilienscout24.de") -> List[ListingSummary]:
-    soup = BeautifulSoup(html, "html.parser")
-    cards = soup.select("[data-is24-expose-id], article[data-obid]")
+    # Cookie walls, captchas, and error pages carry no result cards; a single
+    # regex scan avoids building the full soup tree for them.
+    if not _HAS_CARDS_PATTERN.search(html):
+        return []
+
+    soup = BeautifulSoup(html, _SOUP_FEATURES)
+    cards = _SEL_CARDS.select(soup)
     results: List[ListingSummary] = []
 
     for card in cards:
@@ -36,29 +62,28 @@ def parse_listing_summaries(html: str, *, base_url: str = "https://www.immobilie
         if not external_id:
             continue
 
-        title = _extract_text(
-            card,
-            ".result-list-entry__brand-title, .result-list-entry__data h5, h2, h3",
-        )
+        title = _extract_text(card, _SEL_TITLE)
         price = _extract_price(card)
         detail_url = _extract_detail_url(card, base_url)
         if not (title and price is not None and detail_url):
             continue
 
-        payload = {
-            "external_id": external_id,
-            "title": title,
-            "price_eur": price,
-            "rooms": _extract_float(card, "[data-qa='rooms'], .result-list-entry__primary-criterion:contains('Zimmer')"),
-            "size_sqm": _extract_float(card, "[data-qa='livingSpace'], .result-list-entry__primary-criterion:contains('m²')"),
-            "district": _extract_text(card, ".result-list-entry__address, address, [data-qa='district']"),
-            "detail_url": detail_url,
-        }
-
-        try:
-            results.append(ListingSummary(**payload))
-        except ValidationError:
-            continue
+        rooms, size_sqm = _extract_criteria(card)
+
+        # The extractors already emit validated types (str/int/float/None and
+        # absolute URLs), so model_construct skips pydantic's validator chain
+        # on this hot path.
+        results.append(
+            ListingSummary.model_construct(
+                external_id=external_id,
+                title=title,
+                price_eur=price,
+                rooms=rooms,
+                size_sqm=size_sqm,
+                district=_extract_text(card, _SEL_DISTRICT),
+                detail_url=detail_url,
+            )
+        )
 
     return results
 
@@ -70,8 +95,8 @@ def _normalize_id(raw_id: Optional[str]) -> Optional[str]:
     return match.group(1) if match else raw_id.strip()
 
 
-def _extract_text(card, selector: str) -> Optional[str]:
-    element = card.select_one(selector)
+def _extract_text(card, matcher: sv.SoupSieve) -> Optional[str]:
+    element = matcher.select_one(card)
     if not element:
         return None
     text = element.get_text(strip=True)
@@ -79,10 +104,7 @@ def _extract_text(card, selector: str) -> Optional[str]:
 
 
 def _extract_price(card) -> Optional[int]:
-    text = _extract_text(
-        card,
-        "[data-qa='cold-rent'], .result-list-entry__primary-criterion strong, .result-list-entry__finance strong",
-    )
+    text = _extract_text(card, _SEL_PRICE)
     if not text:
         return None
     match = _PRICE_PATTERN.search(text.replace(",", "."))
@@ -91,18 +113,21 @@ def _extract_price(card) -> Optional[int]:
     return int(match.group(1).replace(".", "").replace(" ", ""))
 
 
-def _extract_float(card, selector: str) -> Optional[float]:
-    element = card.select_one(selector)
-    if not element:
-        return None
-    match = _FLOAT_PATTERN.search(element.get_text())
-    if not match:
-        return None
-    return float(match.group(1).replace(",", "."))
+def _extract_criteria(card) -> tuple[Optional[float], Optional[float]]:
+    rooms: Optional[float] = None
+    size_sqm: Optional[float] = None
+    for match in _CRITERIA_PATTERN.finditer(card.get_text()):
+        if match.lastgroup == "rooms" and rooms is None:
+            rooms = float(match.group("rooms").replace(",", "."))
+        elif match.lastgroup == "sqm" and size_sqm is None:
+            size_sqm = float(match.group("sqm").replace(",", "."))
+        if rooms is not None and size_sqm is not None:
+            break
+    return rooms, size_sqm
 
 
 def _extract_detail_url(card, base_url: str) -> Optional[str]:
-    link = card.select_one("a")
+    link = _SEL_LINK.select_one(card)
     if not link:
         return None
     href = link.get("href")
@@ -3,8 +3,9 @@ from __future__ import annotations
 import asyncio
 import logging
 import random
-from itertools import cycle
-from typing import Any, Mapping, MutableMapping, Sequence
+import time
+from dataclasses import dataclass
+from typing import Any, Mapping, Sequence
 
 import httpx
 
@@ -17,8 +18,21 @@ class SessionManagerError(RuntimeError):
     """Raised when the session manager exhausts retries without success."""
 
 
+@dataclass
+class _HostBackoffState:
+    """Adaptive throttle state for a single host (monotonic-clock based)."""
+
+    next_allowed: float = 0.0
+    delay: float = 0.0
+
+
 class SessionManager:
-    """Manage HTTP sessions with rotating headers, optional proxies, and adaptive backoff."""
+    """
+    Manage HTTP sessions with rotating headers, optional proxies, and adaptive backoff.
+
+    Instances belong to a single asyncio event loop and are not thread-safe;
+    client/user-agent rotation relies on cooperative scheduling instead of locks.
+    """
 
     DEFAULT_USER_AGENTS: Sequence[str] = (
         "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 "
@@ -40,6 +54,7 @@ class SessionManager:
     }
 
     RETRYABLE_STATUSES: Sequence[int] = (403, 408, 409, 425, 429, 500, 502, 503, 504)
+    THROTTLE_STATUSES: Sequence[int] = (429, 503)
 
     def __init__(
         self,
@@ -61,10 +76,17 @@ class SessionManager:
             proxy = self._proxies[idx % len(self._proxies)] if self._proxies else None
             self._clients.append(self._create_client(proxy=proxy, tag=f"client-{idx}"))
 
-        self._client_lock = asyncio.Lock()
         self._client_index = 0
-        self._ua_cycle = cycle(self.DEFAULT_USER_AGENTS)
-        self._ua_lock = asyncio.Lock()
+        # One prebuilt header dict per user agent; _build_headers hands out
+        # references, so these must never be mutated by callers.
+        self._ua_header_variants: tuple[dict[str, str], ...] = tuple(
+            {**self.BASE_HEADERS, "User-Agent": user_agent} for user_agent in self.DEFAULT_USER_AGENTS
+        )
+        self._ua_index = 0
+        # Per-URL cache validators (ETag, Last-Modified) for conditional GETs.
+        self._page_validators: dict[str, tuple[str | None, str | None]] = {}
+        # Per-host throttle state so a 429 on one host never delays the others.
+        self._host_state: dict[str, _HostBackoffState] = {}
         self._owns_clients = True
         self._max_backoff_seconds = max(30.0, self._settings.monitor_backoff_base_seconds * 6)
 
@@ -100,9 +122,15 @@ class SessionManager:
         attempts = max_attempts or self._max_attempts
         last_exc: Exception | None = None
 
+        is_get = method.upper() == "GET"
+        host = httpx.URL(url).host
+
         for attempt in range(attempts):
-            client = await self._next_client()
-            request_headers = await self._build_headers(headers)
+            await self._wait_for_host(host)
+            client = self._next_client()
+            request_headers = self._build_headers(headers)
+            if is_get:
+                request_headers = self._apply_conditional_headers(url, request_headers)
 
             try:
                 response = await client.request(
@@ -137,31 +165,82 @@ class SessionManager:
                     attempt + 1,
                     attempts,
                 )
-                await self._sleep_with_backoff(attempt)
+                if response.status_code in self.THROTTLE_STATUSES:
+                    # _wait_for_host sleeps out the throttle window on the
+                    # next loop iteration, so no extra backoff sleep here.
+                    self._throttle_host(host, retry_after=response.headers.get("Retry-After"))
+                else:
+                    await self._sleep_with_backoff(attempt)
                 continue
 
+            self._relax_host(host)
+            if is_get and response.is_success:
+                self._store_validators(url, response)
             return response
 
         raise SessionManagerError(
             f"Failed to fetch {method} {url} after {attempts} attempts"
         ) from last_exc
 
-    async def _next_client(self) -> httpx.AsyncClient:
-        async with self._client_lock:
-            client = self._clients[self._client_index]
-            self._client_index = (self._client_index + 1) % len(self._clients)
+    def _next_client(self) -> httpx.AsyncClient:
+        client = self._clients[self._client_index]
+        self._client_index = (self._client_index + 1) % len(self._clients)
         return client
 
-    async def _build_headers(self, extra: Mapping[str, str] | None) -> MutableMapping[str, str]:
-        async with self._ua_lock:
-            user_agent = next(self._ua_cycle)
-
-        merged: dict[str, str] = dict(self.BASE_HEADERS)
-        merged["User-Agent"] = user_agent
+    def _build_headers(self, extra: Mapping[str, str] | None) -> Mapping[str, str]:
+        headers = self._ua_header_variants[self._ua_index]
+        self._ua_index = (self._ua_index + 1) % len(self._ua_header_variants)
         if extra:
-            merged.update(extra)
+            return {**headers, **extra}
+        return headers
+
+    def _apply_conditional_headers(self, url: str, request_headers: Mapping[str, str]) -> Mapping[str, str]:
+        validators = self._page_validators.get(url)
+        if not validators:
+            return request_headers
+        etag, last_modified = validators
+        # Copy-on-write: the prebuilt UA variants are shared, never mutated.
+        merged = dict(request_headers)
+        if etag:
+            merged.setdefault("If-None-Match", etag)
+        if last_modified:
+            merged.setdefault("If-Modified-Since", last_modified)
         return merged
 
+    def _store_validators(self, url: str, response: httpx.Response) -> None:
+        etag = response.headers.get("ETag")
+        last_modified = response.headers.get("Last-Modified")
+        if etag or last_modified:
+            self._page_validators[url] = (etag, last_modified)
+
+    async def _wait_for_host(self, host: str) -> None:
+        state = self._host_state.get(host)
+        if not state:
+            return
+        remaining = state.next_allowed - time.monotonic()
+        if remaining > 0:
+            await asyncio.sleep(remaining)
+
+    def _throttle_host(self, host: str, *, retry_after: str | None = None) -> None:
+        state = self._host_state.setdefault(host, _HostBackoffState())
+        base = max(1.0, self._settings.monitor_backoff_base_seconds)
+        state.delay = min(self._max_backoff_seconds, max(base, state.delay * 2))
+        delay = state.delay
+        if retry_after:
+            try:
+                delay = max(delay, float(retry_after))
+            except ValueError:
+                pass  # HTTP-date form of Retry-After; fall back to our delay
+        state.next_allowed = time.monotonic() + delay + random.uniform(0, delay * 0.25)
+
+    def _relax_host(self, host: str) -> None:
+        state = self._host_state.get(host)
+        if state and state.delay:
+            # Decay toward zero on success so a healthy host recovers quickly.
+            state.delay *= 0.75
+            if state.delay < 1.0:
+                state.delay = 0.0
+
     async def _sleep_with_backoff(self, attempt: int) -> None:
         base = max(1.0, self._settings.monitor_backoff_base_seconds)
         delay = min(self._max_backoff_seconds, base * (2 ** attempt))
@@ -169,12 +248,21 @@ class SessionManager:
         await asyncio.sleep(delay + jitter)
 
     def _create_client(self, *, proxy: str | None, tag: str) -> httpx.AsyncClient:
-        limits = httpx.Limits(max_keepalive_connections=8, max_connections=20, keepalive_expiry=60)
+        # keepalive_expiry must outlive the poll interval so sockets survive
+        # idle time between cycles instead of re-handshaking every cycle.
+        limits = httpx.Limits(
+            max_keepalive_connections=self._settings.monitor_http_max_keepalive,
+            max_connections=self._settings.monitor_http_max_connections,
+            keepalive_expiry=120,
+        )
         return httpx.AsyncClient(
             proxies=proxy,
+            http2=True,
             timeout=self._timeout,
             follow_redirects=True,
             limits=limits,
             headers=self.BASE_HEADERS,
-            transport=httpx.AsyncHTTPTransport(retries=0),
+            # The explicit transport overrides the client-level http2 flag,
+            # so it must be enabled in both places.
+            transport=httpx.AsyncHTTPTransport(retries=0, http2=True),
         )